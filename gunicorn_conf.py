@@ -0,0 +1,11 @@
+# Gunicorn configuration for serving the search API in production:
+#   gunicorn -c gunicorn_conf.py server:app
+#
+# gevent workers monkey-patch blocking I/O themselves before loading the app,
+# so concurrent requests overlap their waits on the embedding API and Qdrant
+import os
+
+bind = os.getenv("BIND", "0.0.0.0:5000")
+worker_class = "gevent"
+workers = int(os.getenv("WEB_CONCURRENCY", (os.cpu_count() or 1) * 2 + 1))
+worker_connections = 256
@@ -10,9 +10,13 @@ def main():
     base_url = os.getenv("API_BASE_URL", "http://localhost:11434/v1")
     api_key = os.getenv("API_KEY", "")
     qdrant_url = os.getenv("QDRANT_URL", "http://localhost:6333")
+    qdrant_grpc_port = int(os.getenv("QDRANT_GRPC_PORT", "6334"))
     collection_name = os.getenv("COLLECTION_NAME", "documents")
     model = os.getenv("DEFAULT_LLM_MODEL", "qwen2.5-coder:14b")
     embedding_model = os.getenv("DEFAULT_EMBEDDING_MODEL", "snowflake-arctic-embed:latest")
+    rpm = float(os.getenv("LLM_RPM", "3500"))
+    tpm = float(os.getenv("LLM_TPM", "90000"))
+    max_text_chars = int(os.getenv("MAX_TEXT_CHARS", "16384"))
 
     # Validate required environment variables
     if not base_url:
@@ -26,9 +30,13 @@ def main():
         base_url=base_url,
         api_key=api_key,
         qdrant_url=qdrant_url,
+        qdrant_grpc_port=qdrant_grpc_port,
         collection_name=collection_name,
         model=model,
-        embedding_model=embedding_model
+        embedding_model=embedding_model,
+        rpm=rpm,
+        tpm=tpm,
+        max_text_chars=max_text_chars
     )
     
     # Index all PDF files in the cvs directory
@@ -39,6 +47,8 @@ def main():
         print("No PDF files found in the cvs directory")
     except Exception as e:
         print(f"An error occurred while indexing: {str(e)}")
+    finally:
+        indexer.close()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
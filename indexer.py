@@ -1,12 +1,366 @@
 import os
-from typing import List, Dict, Any, Optional
-import requests
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, List, Dict, Any, Optional, Set, Tuple, Union
+import hashlib
+import sqlite3
+import httpx
+import numpy as np
 from qdrant_client import QdrantClient
 from qdrant_client.http import models
-import PyPDF2
-import uuid
+import pypdfium2 as pdfium
+import textwrap
+import threading
 import time
-import json
+import uuid
+import orjson
+
+
+# Number of files embedded per request in index_directory
+EMBEDDING_BATCH_SIZE = 32
+
+# Number of points upserted per request in index_directory
+UPSERT_BATCH_SIZE = 256
+
+# Maximum number of metadata extraction requests in flight at once
+METADATA_MAX_CONCURRENCY = 8
+
+# Attempts per request before giving up on rate limited (429) responses
+MAX_RETRIES = 3
+
+# Default request and token budgets per minute shared by LLM and embedding calls
+DEFAULT_LLM_RPM = 3500
+DEFAULT_LLM_TPM = 90000
+
+# Default number of characters of a CV sent to the APIs (~4096 tokens)
+DEFAULT_MAX_TEXT_CHARS = 16384
+
+# Namespace of the deterministic point IDs derived from content hashes
+POINT_ID_NAMESPACE = uuid.UUID("0a458a1f-3320-498d-aeb7-b0c4d4752f8d")
+
+# Metadata fields given a keyword payload index for filtered search
+KEYWORD_INDEX_FIELDS = [
+    "metadata.name",
+    "metadata.current_role",
+    "metadata.location",
+    "metadata.skills",
+    "metadata.languages"
+]
+
+# Prompt instructing the model to extract specific metadata, dedented to save tokens
+_PROMPT = textwrap.dedent("""\
+    Extract the following information from the CV text in JSON format:
+    - name: Full name of the candidate
+    - age: Age if mentioned, otherwise null
+    - years_of_experience: Total years of professional experience
+    - skills: List of technical skills and tools
+    - languages: List of programming languages
+    - education: List of education details with degree, institution, and year
+    - current_role: Current or most recent job title
+    - location: Location if mentioned, otherwise null
+
+    Return ONLY the JSON object, no additional text.
+    If a field cannot be determined, use null.
+    For lists, return empty arrays if no items found.""").strip()
+
+_SYSTEM_MSG = {"role": "system", "content": "You are a precise CV parser that extracts structured metadata."}
+
+_RESP_FMT = {"type": "json_object"}
+
+# Default location of the persistent embedding cache
+DEFAULT_CACHE_PATH = "cache.db"
+
+
+class RateLimiter:
+    """Token bucket throttling requests per minute and tokens per minute.
+    
+    Capacity refills continuously with elapsed time, so calls are released
+    as soon as the budget allows rather than after a fixed delay.
+    """
+    
+    def __init__(self, rpm: float, tpm: float):
+        """Initialize the RateLimiter with full capacity.
+        
+        Args:
+            rpm: Maximum number of requests per minute
+            tpm: Maximum number of tokens per minute
+        """
+        self.rpm = rpm
+        self.tpm = tpm
+        self.available_request_capacity = float(rpm)
+        self.available_token_capacity = float(tpm)
+        self._last_update = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _try_acquire(self, tokens: int) -> float:
+        """Consume capacity for one request if the budget allows it.
+        
+        Args:
+            tokens: Estimated number of tokens used by the request
+            
+        Returns:
+            0 if capacity was consumed, otherwise seconds to wait before retrying
+        """
+        # A single request larger than the whole budget would never fit
+        tokens = min(tokens, self.tpm)
+        
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._last_update
+            self._last_update = now
+            
+            self.available_request_capacity = min(
+                self.rpm, self.available_request_capacity + self.rpm * elapsed / 60
+            )
+            self.available_token_capacity = min(
+                self.tpm, self.available_token_capacity + self.tpm * elapsed / 60
+            )
+            
+            if self.available_request_capacity >= 1 and self.available_token_capacity >= tokens:
+                self.available_request_capacity -= 1
+                self.available_token_capacity -= tokens
+                return 0.0
+            
+            request_wait = (1 - self.available_request_capacity) * 60 / self.rpm
+            token_wait = (tokens - self.available_token_capacity) * 60 / self.tpm
+            return max(request_wait, token_wait)
+    
+    async def acquire(self, tokens: int = 0) -> None:
+        """Wait asynchronously until the budget allows one more request.
+        
+        Args:
+            tokens: Estimated number of tokens used by the request
+        """
+        while (wait := self._try_acquire(tokens)) > 0:
+            await asyncio.sleep(wait)
+    
+    def acquire_sync(self, tokens: int = 0) -> None:
+        """Block until the budget allows one more request.
+        
+        Args:
+            tokens: Estimated number of tokens used by the request
+        """
+        while (wait := self._try_acquire(tokens)) > 0:
+            time.sleep(wait)
+
+
+def _estimate_tokens(texts: List[str]) -> int:
+    """Roughly estimate the number of tokens in some texts (~4 characters per token)."""
+    return sum(len(text) for text in texts) // 4
+
+
+def _create_http_client() -> httpx.Client:
+    """Create a pooled HTTP/2 client reusing connections across API calls."""
+    return httpx.Client(
+        http2=True,
+        timeout=120,  # Add timeout to prevent hanging
+        limits=httpx.Limits(max_keepalive_connections=32, max_connections=64)
+    )
+
+
+def _create_async_http_client() -> httpx.AsyncClient:
+    """Create a pooled HTTP/2 client for concurrent asynchronous API calls."""
+    return httpx.AsyncClient(
+        http2=True,
+        timeout=120,  # Add timeout to prevent hanging
+        limits=httpx.Limits(max_keepalive_connections=32, max_connections=64)
+    )
+
+
+def _post_with_retries(
+    client: httpx.Client,
+    rate_limiter: RateLimiter,
+    url: str,
+    headers: Dict[str, str],
+    data: Dict[str, Any],
+    tokens: int
+) -> httpx.Response:
+    """POST a JSON request once the rate limiter allows it.
+    
+    Rate limited (429) responses are retried with exponential backoff.
+    
+    Args:
+        client: HTTP client to send the request with
+        rate_limiter: Rate limiter to acquire capacity from before each attempt
+        url: URL to post to
+        headers: Request headers
+        data: JSON request body
+        tokens: Estimated number of tokens used by the request
+        
+    Returns:
+        The last response received
+    """
+    for attempt in range(MAX_RETRIES):
+        rate_limiter.acquire_sync(tokens)
+        response = client.post(url, headers=headers, content=orjson.dumps(data))
+        if response.status_code != 429 or attempt == MAX_RETRIES - 1:
+            return response
+        time.sleep(2 ** attempt)
+
+
+async def _post_with_retries_async(
+    client: httpx.AsyncClient,
+    rate_limiter: RateLimiter,
+    url: str,
+    headers: Dict[str, str],
+    data: Dict[str, Any],
+    tokens: int
+) -> httpx.Response:
+    """Asynchronously POST a JSON request once the rate limiter allows it.
+    
+    Rate limited (429) responses are retried with exponential backoff.
+    
+    Args:
+        client: HTTP client to send the request with
+        rate_limiter: Rate limiter to acquire capacity from before each attempt
+        url: URL to post to
+        headers: Request headers
+        data: JSON request body
+        tokens: Estimated number of tokens used by the request
+        
+    Returns:
+        The last response received
+    """
+    for attempt in range(MAX_RETRIES):
+        await rate_limiter.acquire(tokens)
+        response = await client.post(url, headers=headers, content=orjson.dumps(data))
+        if response.status_code != 429 or attempt == MAX_RETRIES - 1:
+            return response
+        await asyncio.sleep(2 ** attempt)
+
+
+def _extract_text_from_pdf(file_path: str, max_chars: int = DEFAULT_MAX_TEXT_CHARS) -> str:
+    """Extract text content from a PDF file.
+    
+    Defined at module level so it can be pickled and run in worker processes.
+    Pages identical to an earlier page are skipped and the text is truncated
+    to ``max_chars`` to bound the tokens sent to the APIs.
+    
+    Args:
+        file_path: Path to the PDF file
+        max_chars: Maximum number of characters to keep
+        
+    Returns:
+        Extracted text from the PDF
+    """
+    try:
+        pdf = pdfium.PdfDocument(file_path)
+        try:
+            pages = []
+            seen = set()
+            for page in pdf:
+                page_text = page.get_textpage().get_text_range()
+                page_hash = hashlib.blake2b(page_text.encode(), digest_size=16).digest()
+                if page_hash in seen:
+                    continue
+                seen.add(page_hash)
+                pages.append(page_text)
+        finally:
+            pdf.close()
+        return "\n".join(pages).strip()[:max_chars]
+    except Exception as e:
+        raise Exception(f"Error extracting text from PDF {file_path}: {str(e)}")
+
+
+def _content_hash(text: str) -> str:
+    """Return the SHA-256 hex digest identifying some extracted text."""
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+class EmbeddingCache:
+    """Persistent cache of embeddings and metadata keyed by content hash.
+    
+    Backed by a local SQLite file so re-indexing unchanged files skips both
+    the embedding and the metadata extraction API calls. Entries are also
+    keyed by the embedding model, the LLM model and the embedding dimension,
+    so changing any of them invalidates the cached results.
+    """
+    
+    def __init__(self, path: str = DEFAULT_CACHE_PATH):
+        """Open the cache, creating its table if needed.
+        
+        Args:
+            path: Path to the SQLite database file
+        """
+        self.path = path
+        self._conn = sqlite3.connect(path)
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS embeddings (
+                hash TEXT NOT NULL,
+                model TEXT NOT NULL,
+                llm_model TEXT NOT NULL,
+                dim INTEGER NOT NULL,
+                vector BLOB NOT NULL,
+                metadata_json TEXT NOT NULL,
+                PRIMARY KEY (hash, model, llm_model, dim)
+            )"""
+        )
+        self._conn.commit()
+    
+    def get(
+        self,
+        content_hash: str,
+        model: str,
+        llm_model: str,
+        dim: Optional[int] = None
+    ) -> Optional[Tuple[List[float], Dict[str, Any]]]:
+        """Look up a cached embedding and metadata.
+        
+        Args:
+            content_hash: Hash of the indexed text
+            model: The model the embedding was generated with
+            llm_model: The model the metadata was extracted with
+            dim: Expected embedding dimension, any dimension matches if None
+            
+        Returns:
+            Tuple of (embedding, metadata), or None if not cached
+        """
+        row = self._conn.execute(
+            """SELECT vector, metadata_json FROM embeddings
+            WHERE hash = ? AND model = ? AND llm_model = ? AND (? IS NULL OR dim = ?)""",
+            (content_hash, model, llm_model, dim, dim)
+        ).fetchone()
+        if row is None:
+            return None
+        
+        vector, metadata_json = row
+        return np.frombuffer(vector, dtype=np.float32).tolist(), orjson.loads(metadata_json)
+    
+    def put(
+        self,
+        content_hash: str,
+        model: str,
+        llm_model: str,
+        embedding: List[float],
+        metadata: Dict[str, Any]
+    ) -> None:
+        """Store an embedding and its metadata.
+        
+        Args:
+            content_hash: Hash of the indexed text
+            model: The model the embedding was generated with
+            llm_model: The model the metadata was extracted with
+            embedding: Embedding vector of the text
+            metadata: Metadata extracted from the text
+        """
+        vector = np.asarray(embedding, dtype=np.float32)
+        self._conn.execute(
+            "INSERT OR REPLACE INTO embeddings VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                content_hash,
+                model,
+                llm_model,
+                len(vector),
+                vector.tobytes(),
+                orjson.dumps(metadata).decode()
+            )
+        )
+        self._conn.commit()
+    
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
 
 
 class MetaDataExtractor:
@@ -14,7 +368,10 @@ class MetaDataExtractor:
         self,
         base_url: str,
         api_key: str,
-        model: str
+        model: str,
+        max_concurrency: int = METADATA_MAX_CONCURRENCY,
+        rate_limiter: Optional[RateLimiter] = None,
+        http_client: Optional[httpx.Client] = None
     ):
         """Initialize the MetaDataExtractor with API configurations.
         
@@ -22,111 +379,225 @@ class MetaDataExtractor:
             base_url: Base URL for the OpenAI API endpoint
             api_key: API key for authentication
             model: The OpenAI model to use for extraction
+            max_concurrency: Maximum number of concurrent requests in extract_metadata_many
+            rate_limiter: Rate limiter throttling API calls, defaults to the default budgets
+            http_client: Pooled HTTP client for API calls, created if not given
         """
         self.base_url = base_url
         self.api_key = api_key
         self.model = model
+        self.max_concurrency = max_concurrency
+        self.rate_limiter = rate_limiter or RateLimiter(DEFAULT_LLM_RPM, DEFAULT_LLM_TPM)
+        self._owns_http = http_client is None
+        self._http = http_client or _create_http_client()
+        self._headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+            "HTTP-Referer": "https://github.com/musdechocolate/HRAI", 
+            "X-Title": "HRAI - CV Screener"
+        }
     
-    def _call_openai(self, text: str) -> Dict[str, Any]:
-        """Call OpenAI API to extract metadata from text.
+    def close(self) -> None:
+        """Close the HTTP client if it was created by this extractor."""
+        if self._owns_http:
+            self._http.close()
+    
+    def _build_request(self, text: str) -> Dict[str, Any]:
+        """Build the body of a metadata extraction request.
         
         Args:
             text: The CV text to analyze
             
         Returns:
-            Dictionary containing extracted metadata
+            Request body for the chat completions endpoint
         """
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-            "HTTP-Referer": "https://github.com/musdechocolate/HRAI", 
-            "X-Title": "HRAI - CV Screener"
-        }
-        
-        # Create a prompt that instructs the model to extract specific metadata
-        prompt = """Extract the following information from the CV text in JSON format:
-        - name: Full name of the candidate
-        - age: Age if mentioned, otherwise null
-        - years_of_experience: Total years of professional experience
-        - skills: List of technical skills and tools
-        - languages: List of programming languages
-        - education: List of education details with degree, institution, and year
-        - current_role: Current or most recent job title
-        - location: Location if mentioned, otherwise null
-        
-        Return ONLY the JSON object, no additional text.
-        If a field cannot be determined, use null.
-        For lists, return empty arrays if no items found."""
-        
-        data = {
+        return {
             "model": self.model,
             "messages": [
-                {"role": "system", "content": "You are a precise CV parser that extracts structured metadata."},
-                {"role": "user", "content": f"{prompt}\n\nCV Text:\n{text}"}
+                _SYSTEM_MSG,
+                {"role": "user", "content": _PROMPT + "\n\nCV Text:\n" + text}
             ],
-            "response_format": { "type": "json_object" }
+            "response_format": _RESP_FMT
         }
+    
+    def _parse_response(self, response: httpx.Response) -> Dict[str, Any]:
+        """Parse the metadata JSON out of a chat completions response.
         
+        Args:
+            response: Response of the chat completions endpoint
+            
+        Returns:
+            Dictionary containing extracted metadata
+        """
         try:
-            # Add a small delay to avoid rate limiting
-            time.sleep(0.5)
+            content = orjson.loads(response.content)["choices"][0]["message"]["content"]
+            return orjson.loads(content)
+        except (orjson.JSONDecodeError, KeyError) as e:
+            print(f"Response content: {response.text}")
+            raise Exception(f"Failed to parse OpenAI response: {str(e)}")
+    
+    def _call_openai(self, text: str) -> Dict[str, Any]:
+        """Call OpenAI API to extract metadata from text.
+        
+        Args:
+            text: The CV text to analyze
             
-            response = requests.post(
+        Returns:
+            Dictionary containing extracted metadata
+        """
+        data = self._build_request(text)
+        
+        try:
+            response = _post_with_retries(
+                self._http,
+                self.rate_limiter,
                 f"{self.base_url}/chat/completions",
-                headers=headers,
-                json=data,
-                timeout=120  # Add timeout to prevent hanging
+                headers=self._headers,
+                data=data,
+                tokens=_estimate_tokens([text])
             )
             response.raise_for_status()
             
-            # Parse the JSON response
-            try:
-                return json.loads(response.json()["choices"][0]["message"]["content"])
-            except (json.JSONDecodeError, KeyError) as e:
-                print(f"Response content: {response.text}")
-                raise Exception(f"Failed to parse OpenAI response: {str(e)}")
+            return self._parse_response(response)
                 
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             print(f"Request error: {str(e)}")
-            if hasattr(e, 'response') and e.response is not None:
+            if isinstance(e, httpx.HTTPStatusError):
                 print(f"Response status code: {e.response.status_code}")
                 print(f"Response content: {e.response.text}")
             raise Exception(f"API request failed: {str(e)}")
     
-    def extract_metadata(self, text: str) -> Dict[str, Any]:
-        """Extract metadata from CV text.
+    async def _call_openai_async(self, client: httpx.AsyncClient, text: str) -> Dict[str, Any]:
+        """Call OpenAI API asynchronously to extract metadata from text.
+        
+        Requests are throttled by the rate limiter and rate limited (429)
+        responses are retried with exponential backoff.
         
         Args:
+            client: HTTP client to send the request with
             text: The CV text to analyze
             
         Returns:
             Dictionary containing extracted metadata
         """
+        data = self._build_request(text)
+        
         try:
-            metadata = self._call_openai(text)
+            response = await _post_with_retries_async(
+                client,
+                self.rate_limiter,
+                f"{self.base_url}/chat/completions",
+                headers=self._headers,
+                data=data,
+                tokens=_estimate_tokens([text])
+            )
+            response.raise_for_status()
             
-            # Ensure all expected fields are present
-            expected_fields = {
-                "name": None,
-                "age": None,
-                "years_of_experience": None,
-                "skills": [],
-                "languages": [],
-                "education": [],
-                "current_role": None,
-                "location": None
-            }
+            return self._parse_response(response)
+            
+        except httpx.HTTPError as e:
+            print(f"Request error: {str(e)}")
+            if isinstance(e, httpx.HTTPStatusError):
+                print(f"Response status code: {e.response.status_code}")
+                print(f"Response content: {e.response.text}")
+            raise Exception(f"API request failed: {str(e)}")
+    
+    def _normalize_metadata(self, metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """Fill in defaults for any expected fields missing from the metadata.
+        
+        Args:
+            metadata: Metadata returned by the model
             
-            # Update with extracted data, keeping defaults for missing fields
-            metadata = {**expected_fields, **metadata}
+        Returns:
+            Metadata containing all expected fields
+        """
+        # Ensure all expected fields are present
+        expected_fields = {
+            "name": None,
+            "age": None,
+            "years_of_experience": None,
+            "skills": [],
+            "languages": [],
+            "education": [],
+            "current_role": None,
+            "location": None
+        }
+        
+        # Update with extracted data, keeping defaults for missing fields
+        return {**expected_fields, **metadata}
+    
+    def extract_metadata(self, text: str) -> Dict[str, Any]:
+        """Extract metadata from CV text.
+        
+        Args:
+            text: The CV text to analyze
             
-            return metadata
+        Returns:
+            Dictionary containing extracted metadata
+        """
+        try:
+            return self._normalize_metadata(self._call_openai(text))
+        except Exception as e:
+            raise Exception(f"Failed to extract metadata: {str(e)}")
+    
+    async def extract_metadata_async(self, client: httpx.AsyncClient, text: str) -> Dict[str, Any]:
+        """Extract metadata from CV text asynchronously.
+        
+        Args:
+            client: HTTP client to send the request with
+            text: The CV text to analyze
             
+        Returns:
+            Dictionary containing extracted metadata
+        """
+        try:
+            return self._normalize_metadata(await self._call_openai_async(client, text))
         except Exception as e:
             raise Exception(f"Failed to extract metadata: {str(e)}")
+    
+    async def extract_metadata_many(
+        self,
+        texts: List[str],
+        client: Optional[httpx.AsyncClient] = None,
+        on_result: Optional[Callable[[int, Dict[str, Any]], None]] = None
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """Extract metadata from several CV texts concurrently.
+        
+        At most ``max_concurrency`` requests are in flight at any time. A
+        failure for one text does not cancel the others: its exception is
+        returned in its place instead.
+        
+        Args:
+            texts: The CV texts to analyze
+            client: HTTP client to send the requests with, created if not given
+            on_result: Called with (index, metadata) as soon as each text succeeds
+            
+        Returns:
+            List of metadata dictionaries or exceptions, in the same order as the input texts
+        """
+        if client is None:
+            async with _create_async_http_client() as client:
+                return await self.extract_metadata_many(texts, client, on_result)
+        
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def extract(i: int, text: str) -> Union[Dict[str, Any], Exception]:
+            async with semaphore:
+                try:
+                    metadata = await self.extract_metadata_async(client, text)
+                except Exception as e:
+                    return e
+            if on_result is not None:
+                on_result(i, metadata)
+            return metadata
+        
+        return await asyncio.gather(*(extract(i, text) for i, text in enumerate(texts)))
 
 
 class Indexer:
+    # (Qdrant URL, collection name) pairs already checked in this process
+    _checked_collections: Set[Tuple[str, str]] = set()
+    
     def __init__(
         self,
         base_url: str,
@@ -134,7 +605,12 @@ class Indexer:
         model: str,
         embedding_model: str,
         qdrant_url: str,
-        collection_name: str = "documents"
+        collection_name: str = "documents",
+        rpm: float = DEFAULT_LLM_RPM,
+        tpm: float = DEFAULT_LLM_TPM,
+        cache_path: str = DEFAULT_CACHE_PATH,
+        qdrant_grpc_port: int = 6334,
+        max_text_chars: int = DEFAULT_MAX_TEXT_CHARS
     ):
         """Initialize the Indexer with API configurations.
         
@@ -145,24 +621,44 @@ class Indexer:
             embedding_model: The model to use for embeddings
             qdrant_url: URL of the Qdrant instance
             collection_name: Name of the collection in Qdrant
+            rpm: Maximum number of API requests per minute
+            tpm: Maximum number of API tokens per minute
+            cache_path: Path to the persistent embedding cache
+            qdrant_grpc_port: gRPC port of the Qdrant instance
+            max_text_chars: Maximum number of characters of a CV to index
         """
         self.base_url = base_url
         self.api_key = api_key
         self.model = model
         self.embedding_model = embedding_model
-        self.qdrant_client = QdrantClient(url=qdrant_url)
+        dimension = os.getenv("EMBEDDING_DIMENSION")
+        self.embedding_dimension = int(dimension) if dimension else None
+        self.qdrant_client = QdrantClient(
+            url=qdrant_url,
+            prefer_grpc=True,
+            grpc_port=qdrant_grpc_port
+        )
         self.collection_name = collection_name
+        self.max_text_chars = max_text_chars
+        self.rate_limiter = RateLimiter(rpm, tpm)
+        self._http = _create_http_client()
         self.metadata_extractor = MetaDataExtractor(
             base_url=base_url,
             api_key=api_key,
-            model=model
+            model=model,
+            rate_limiter=self.rate_limiter,
+            http_client=self._http
         )
+        self.embedding_cache = EmbeddingCache(cache_path)
         
-        # Create collection if it doesn't exist
-        self._ensure_collection_exists()
+        # Create collection if it doesn't exist, once per process
+        collection_key = (qdrant_url, collection_name)
+        if collection_key not in Indexer._checked_collections:
+            self._ensure_collection_exists()
+            Indexer._checked_collections.add(collection_key)
     
     def _ensure_collection_exists(self):
-        """Create the collection in Qdrant if it doesn't exist."""
+        """Create the collection in Qdrant if it doesn't exist and ensure its payload indexes."""
         collections = self.qdrant_client.get_collections().collections
         exists = any(col.name == self.collection_name for col in collections)
         
@@ -170,19 +666,43 @@ class Indexer:
             self.qdrant_client.create_collection(
                 collection_name=self.collection_name,
                 vectors_config=models.VectorParams(
-                    size=int(os.getenv("EMBEDDING_DIMENSION")),
+                    size=self.embedding_dimension,
                     distance=models.Distance.COSINE
-                )
+                ),
+                # Keep int8 copies of the vectors in RAM for faster, 4x smaller search
+                quantization_config=models.ScalarQuantization(
+                    scalar=models.ScalarQuantizationConfig(
+                        type=models.ScalarType.INT8,
+                        always_ram=True
+                    )
+                ),
+                optimizers_config=models.OptimizersConfigDiff(memmap_threshold=20000),
+                hnsw_config=models.HnswConfigDiff(m=16, ef_construct=128)
+            )
+        
+        # Index the metadata fields used in search filters, including on
+        # collections created before these indexes existed (this is idempotent)
+        for field_name in KEYWORD_INDEX_FIELDS:
+            self.qdrant_client.create_payload_index(
+                collection_name=self.collection_name,
+                field_name=field_name,
+                field_schema=models.PayloadSchemaType.KEYWORD
             )
     
-    def _get_embeddings(self, text: str) -> List[float]:
-        """Get embeddings from the OpenAI API.
+    def close(self) -> None:
+        """Close the HTTP client, Qdrant client and embedding cache."""
+        self._http.close()
+        self.qdrant_client.close()
+        self.embedding_cache.close()
+    
+    def _build_embeddings_request(self, texts: List[str]) -> Tuple[Dict[str, str], Dict[str, Any]]:
+        """Build the headers and body of an embeddings request.
         
         Args:
-            text: Text to generate embeddings for
+            texts: Texts to generate embeddings for
             
         Returns:
-            List of embedding values
+            Tuple of (headers, data) for the embeddings endpoint
         """
         headers = {
             "Authorization": f"Bearer {self.api_key}",
@@ -190,37 +710,160 @@ class Indexer:
         }
         
         data = {
-            "input": text,
+            "input": texts,
             "model": self.embedding_model
         }
         
-        response = requests.post(
+        return headers, data
+    
+    def _get_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Get embeddings for a batch of texts from the OpenAI API.
+        
+        Args:
+            texts: Texts to generate embeddings for
+            
+        Returns:
+            List of embedding vectors, in the same order as the input texts
+        """
+        headers, data = self._build_embeddings_request(texts)
+        
+        response = _post_with_retries(
+            self._http,
+            self.rate_limiter,
+            f"{self.base_url}/embeddings",
+            headers=headers,
+            data=data,
+            tokens=_estimate_tokens(texts)
+        )
+        response.raise_for_status()
+        
+        return [d["embedding"] for d in orjson.loads(response.content)["data"]]
+    
+    async def _get_embeddings_async(
+        self,
+        client: httpx.AsyncClient,
+        texts: List[str]
+    ) -> List[List[float]]:
+        """Get embeddings for a batch of texts from the OpenAI API asynchronously.
+        
+        Args:
+            client: HTTP client to send the request with
+            texts: Texts to generate embeddings for
+            
+        Returns:
+            List of embedding vectors, in the same order as the input texts
+        """
+        headers, data = self._build_embeddings_request(texts)
+        
+        response = await _post_with_retries_async(
+            client,
+            self.rate_limiter,
             f"{self.base_url}/embeddings",
             headers=headers,
-            json=data
+            data=data,
+            tokens=_estimate_tokens(texts)
         )
         response.raise_for_status()
         
-        return response.json()["data"][0]["embedding"]
+        return [d["embedding"] for d in orjson.loads(response.content)["data"]]
     
-    def _extract_text_from_pdf(self, file_path: str) -> str:
-        """Extract text content from a PDF file.
+    async def _extract_and_embed_async(
+        self,
+        texts: List[str],
+        hashes: List[str],
+        batch_size: int
+    ) -> Tuple[Dict[int, Tuple[List[float], Dict[str, Any]]], Dict[int, Exception]]:
+        """Extract metadata and embeddings for texts, overlapping both API calls.
+        
+        Metadata extraction and embedding are independent, so running them
+        concurrently takes as long as the slower of the two instead of both.
+        Each text is written to the embedding cache as soon as both its results
+        are available, and a failure only affects the texts it concerns.
+        
+        Args:
+            texts: The CV texts to analyze
+            hashes: Content hashes of the texts, used as cache keys
+            batch_size: Number of texts to embed per request
+            
+        Returns:
+            Tuple of (results, errors): (embedding, metadata) tuples and
+            exceptions, both keyed by index in the input texts
+        """
+        metadatas: Dict[int, Dict[str, Any]] = {}
+        embeddings: Dict[int, List[float]] = {}
+        results: Dict[int, Tuple[List[float], Dict[str, Any]]] = {}
+        errors: Dict[int, Exception] = {}
+        
+        def complete(i: int) -> None:
+            if i in metadatas and i in embeddings:
+                results[i] = (embeddings[i], metadatas[i])
+                self.embedding_cache.put(
+                    hashes[i], self.embedding_model, self.model, embeddings[i], metadatas[i]
+                )
+        
+        def on_metadata(i: int, metadata: Dict[str, Any]) -> None:
+            metadatas[i] = metadata
+            complete(i)
+        
+        async with _create_async_http_client() as client:
+            async def embed() -> None:
+                for start in range(0, len(texts), batch_size):
+                    batch = range(start, min(start + batch_size, len(texts)))
+                    try:
+                        batch_embeddings = await self._get_embeddings_async(
+                            client, [texts[i] for i in batch]
+                        )
+                    except Exception as e:
+                        for i in batch:
+                            errors.setdefault(i, Exception(f"Failed to get embeddings: {str(e)}"))
+                        continue
+                    for i, embedding in zip(batch, batch_embeddings):
+                        embeddings[i] = embedding
+                        complete(i)
+                    print(f"Embedded {batch.stop}/{len(texts)} files")
+            
+            metadata_results, _ = await asyncio.gather(
+                self.metadata_extractor.extract_metadata_many(texts, client, on_metadata),
+                embed()
+            )
+        
+        for i, result in enumerate(metadata_results):
+            if isinstance(result, Exception):
+                errors[i] = result
+        
+        return results, errors
+    
+    def _build_point(
+        self,
+        file_path: str,
+        text: str,
+        content_hash: str,
+        metadata: Dict[str, Any],
+        embedding: List[float]
+    ) -> models.PointStruct:
+        """Build a Qdrant point for an indexed PDF file.
         
         Args:
             file_path: Path to the PDF file
+            text: Extracted text of the PDF
+            content_hash: Hash of the text, from which the point ID is derived
+            metadata: Metadata extracted from the text
+            embedding: Embedding vector of the text
             
         Returns:
-            Extracted text from the PDF
+            Point ready to be upserted into Qdrant
         """
-        text = ""
-        try:
-            with open(file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                for page in pdf_reader.pages:
-                    text += page.extract_text() + "\n"
-            return text.strip()
-        except Exception as e:
-            raise Exception(f"Error extracting text from PDF {file_path}: {str(e)}")
+        # Derive the ID from the content so re-indexing overwrites the same point
+        return models.PointStruct(
+            id=str(uuid.uuid5(POINT_ID_NAMESPACE, content_hash)),
+            vector=embedding,
+            payload={
+                "text": text,
+                "filename": os.path.basename(file_path),
+                "filepath": file_path,
+                "metadata": metadata
+            }
+        )
     
     def index_file(self, file_path: str, id_field: str = None) -> None:
         """Index a PDF file into Qdrant.
@@ -233,48 +876,131 @@ class Indexer:
             raise FileNotFoundError(f"File not found: {file_path}")
         
         # Extract text from PDF
-        text = self._extract_text_from_pdf(file_path)
-        
-        # Extract metadata
-        metadata = self.metadata_extractor.extract_metadata(text)
+        text = _extract_text_from_pdf(file_path, self.max_text_chars)
         
-        # Get embeddings
-        embedding = self._get_embeddings(text)
-        
-        # Generate a UUID for the point ID
-        point_id = str(uuid.uuid4())
+        # Reuse the embedding and metadata if this content was already indexed
+        content_hash = _content_hash(text)
+        cached = self.embedding_cache.get(
+            content_hash, self.embedding_model, self.model, self.embedding_dimension
+        )
+        if cached is not None:
+            embedding, metadata = cached
+        else:
+            # Extract metadata
+            metadata = self.metadata_extractor.extract_metadata(text)
+            
+            # Get embeddings
+            embedding = self._get_embeddings([text])[0]
+            self.embedding_cache.put(
+                content_hash, self.embedding_model, self.model, embedding, metadata
+            )
         
         # Store in Qdrant
         self.qdrant_client.upsert(
             collection_name=self.collection_name,
-            points=[
-                models.PointStruct(
-                    id=point_id,
-                    vector=embedding,
-                    payload={
-                        "text": text,
-                        "filename": os.path.basename(file_path),
-                        "filepath": file_path,
-                        "metadata": metadata
-                    }
-                )
-            ]
+            points=[self._build_point(file_path, text, content_hash, metadata, embedding)]
         )
     
-    def index_directory(self, directory_path: str, id_field: str = None) -> None:
+    def index_directory(
+        self,
+        directory_path: str,
+        id_field: str = None,
+        batch_size: int = EMBEDDING_BATCH_SIZE
+    ) -> None:
         """Index all PDF files in a directory.
         
+        Embeddings are requested in batches of ``batch_size`` files and points
+        upserted in batches of ``UPSERT_BATCH_SIZE`` to cut down on round-trips.
+        Files whose content is already in the embedding cache skip both API calls.
+        
         Args:
             directory_path: Path to the directory containing PDF files
             id_field: Optional field to use as the point ID (ignored for PDFs)
+            batch_size: Number of files to embed per request
         """
         if not os.path.exists(directory_path):
             raise FileNotFoundError(f"Directory not found: {directory_path}")
-            
-        for filename in os.listdir(directory_path):
-            if filename.endswith('.pdf'):
-                file_path = os.path.join(directory_path, filename)
-                print(f"Indexing {filename}...")
-                self.index_file(file_path, id_field)
-                print(f"Completed indexing {filename}")
-                time.sleep(1)
+        
+        # DirEntry caches file type info, avoiding a stat call per file
+        with os.scandir(directory_path) as dir_entries:
+            files = [
+                entry.path
+                for entry in dir_entries
+                if entry.is_file() and entry.name.lower().endswith('.pdf')
+            ]
+        
+        # Extract text from all PDFs in parallel across cores, skipping unreadable ones.
+        # Workers are spawned rather than forked: this process already runs gRPC threads.
+        print(f"Extracting text from {len(files)} files...")
+        with ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            futures = [
+                executor.submit(_extract_text_from_pdf, file_path, self.max_text_chars)
+                for file_path in files
+            ]
+        
+        total = len(files)
+        extracted = []
+        for file_path, future in zip(files, futures):
+            try:
+                extracted.append((file_path, future.result()))
+            except Exception as e:
+                print(f"Skipping {os.path.basename(file_path)}: {str(e)}")
+        failed = total - len(extracted)
+        files = [file_path for file_path, _ in extracted]
+        texts = [text for _, text in extracted]
+        
+        # Files with identical content share a point ID, so process each content once.
+        # The shortest file name is kept, e.g. "cv.pdf" rather than "cv (1).pdf".
+        hashes = [_content_hash(text) for text in texts]
+        kept: Dict[str, int] = {}
+        for i in sorted(range(len(files)), key=lambda i: (len(os.path.basename(files[i])), files[i])):
+            if hashes[i] in kept:
+                print(
+                    f"Skipping {os.path.basename(files[i])}: "
+                    f"same content as {os.path.basename(files[kept[hashes[i]]])}"
+                )
+            else:
+                kept[hashes[i]] = i
+        duplicates = len(files) - len(kept)
+        unique = sorted(kept.values())
+        files = [files[i] for i in unique]
+        texts = [texts[i] for i in unique]
+        hashes = [hashes[i] for i in unique]
+        
+        # Reuse embeddings and metadata of files whose content was already indexed
+        entries = [
+            self.embedding_cache.get(h, self.embedding_model, self.model, self.embedding_dimension)
+            for h in hashes
+        ]
+        misses = [i for i, entry in enumerate(entries) if entry is None]
+        print(f"Found {len(files) - len(misses)}/{len(files)} files in the embedding cache")
+        
+        # Extract metadata and embed the remaining files concurrently
+        print(f"Extracting metadata from and embedding {len(misses)} files...")
+        results, errors = asyncio.run(self._extract_and_embed_async(
+            [texts[i] for i in misses], [hashes[i] for i in misses], batch_size
+        ))
+        for j, entry in results.items():
+            entries[misses[j]] = entry
+        for j, error in sorted(errors.items()):
+            print(f"Skipping {os.path.basename(files[misses[j]])}: {str(error)}")
+        
+        # Store all successfully processed points in Qdrant in large batches
+        points = [
+            self._build_point(file_path, text, content_hash, entry[1], entry[0])
+            for file_path, text, content_hash, entry in zip(files, texts, hashes, entries)
+            if entry is not None
+        ]
+        for start in range(0, len(points), UPSERT_BATCH_SIZE):
+            self.qdrant_client.upsert(
+                collection_name=self.collection_name,
+                points=points[start:start + UPSERT_BATCH_SIZE],
+                wait=False
+            )
+        print(
+            f"Indexed {len(points)}/{total} files "
+            f"({failed + len(errors)} failed, {duplicates} duplicates)"
+        )
@@ -0,0 +1,137 @@
+import threading
+import time
+from typing import List, Dict, Any, Optional
+import numpy as np
+
+
+class SemanticCache:
+    """Cache of search results keyed by query embedding similarity.
+
+    A query whose embedding has a cosine similarity of at least ``threshold``
+    with a cached query centroid reuses that centroid's results instead of
+    running a new search. Entries expire ``ttl`` seconds after being cached,
+    so results of a re-indexed collection are picked up, and are evicted least
+    recently used first.
+    """
+
+    def __init__(self, threshold: float = 0.86, max_size: int = 1024, ttl: Optional[float] = 300):
+        """Initialize an empty SemanticCache.
+        
+        Args:
+            threshold: Minimum cosine similarity for a query to hit a cached centroid
+            max_size: Maximum number of cached centroids, 0 disables the cache
+            ttl: Seconds a cached entry stays valid, or None to never expire
+        """
+        if max_size < 0:
+            raise ValueError(f"max_size must be non-negative, got {max_size}")
+        
+        self.threshold = threshold
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._norm_centroids: Optional[np.ndarray] = None
+        self._last_used: Optional[np.ndarray] = None
+        self._expires: Optional[np.ndarray] = None
+        self._size = 0
+        self._results: List[List[Dict[str, Any]]] = []
+        self._keys: List[Any] = []
+        self._clock = 0
+        self._lock = threading.Lock()
+
+    def _normalize(self, vector: List[float]) -> np.ndarray:
+        """Return the vector as an L2-normalized float32 array."""
+        vector = np.array(vector, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        if norm > 0:
+            vector /= norm
+        return vector
+
+    def _grow(self, dim: int) -> None:
+        """Double the capacity of the centroid buffer, up to ``max_size``."""
+        if self._norm_centroids is None:
+            self._norm_centroids = np.empty((1, dim), dtype=np.float32)
+            self._last_used = np.empty(1, dtype=np.int64)
+            self._expires = np.empty(1, dtype=np.float64)
+            return
+        
+        extra = min(len(self._norm_centroids), self.max_size - len(self._norm_centroids))
+        self._norm_centroids = np.concatenate(
+            [self._norm_centroids, np.empty((extra, dim), dtype=np.float32)]
+        )
+        self._last_used = np.concatenate([self._last_used, np.empty(extra, dtype=np.int64)])
+        self._expires = np.concatenate([self._expires, np.empty(extra, dtype=np.float64)])
+
+    def get(self, vector: List[float], key: Any = None) -> Optional[List[Dict[str, Any]]]:
+        """Look up the results of the most similar cached query.
+        
+        Args:
+            vector: Embedding of the query
+            key: Other search parameters (limit, filters) that must match exactly
+        
+        Returns:
+            Cached results, or None on a miss
+        """
+        query = self._normalize(vector)
+        
+        with self._lock:
+            self._clock += 1
+            
+            if self._size:
+                # Score the query against every centroid in a single matrix-vector product
+                sims = self._norm_centroids[:self._size] @ query
+                sims[self._expires[:self._size] <= time.monotonic()] = -np.inf
+                best = int(sims.argmax())
+                if sims[best] >= self.threshold:
+                    # Fall back to less similar centroids only if the best one's key differs
+                    if self._keys[best] == key:
+                        candidates = [best]
+                    else:
+                        candidates = np.flatnonzero(sims >= self.threshold)
+                        candidates = candidates[np.argsort(-sims[candidates])]
+                    for i in candidates:
+                        if self._keys[i] == key:
+                            self.hits += 1
+                            self._last_used[i] = self._clock
+                            return self._results[i]
+            
+            self.misses += 1
+            return None
+
+    def put(self, vector: List[float], results: List[Dict[str, Any]], key: Any = None) -> None:
+        """Cache the results of a query.
+        
+        Args:
+            vector: Embedding of the query
+            results: Search results to return for similar queries
+            key: Other search parameters (limit, filters) the results depend on
+        """
+        if self.max_size <= 0:
+            return
+        
+        query = self._normalize(vector)
+        
+        with self._lock:
+            self._clock += 1
+            now = time.monotonic()
+            
+            if self._size < self.max_size:
+                if self._norm_centroids is None or self._size == len(self._norm_centroids):
+                    self._grow(len(query))
+                i = self._size
+                self._size += 1
+                self._results.append(results)
+                self._keys.append(key)
+            else:
+                # Overwrite an expired entry, or else the least recently used one
+                expired = np.flatnonzero(self._expires <= now)
+                i = int(expired[0]) if len(expired) else int(self._last_used.argmin())
+                self._results[i] = results
+                self._keys[i] = key
+            
+            self._norm_centroids[i] = query
+            self._last_used[i] = self._clock
+            self._expires[i] = now + self.ttl if self.ttl is not None else np.inf
+
+    def __len__(self) -> int:
+        return self._size
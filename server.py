@@ -1,16 +1,30 @@
 from flask import Flask, request, jsonify, send_from_directory
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
 from qdrant_client import QdrantClient
 from qdrant_client.http import models
 import os
 from dotenv import load_dotenv
-from typing import List, Dict, Any
-import requests
+from typing import List, Dict, Any, Tuple, Union
+from functools import lru_cache
+import httpx
+import orjson
+from semantic_cache import SemanticCache
 
 # Load environment variables
 load_dotenv()
 
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson for faster (de)serialization."""
+    
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    
+    def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
 app = Flask(__name__, static_folder='.')
+app.json = OrjsonProvider(app)
 CORS(app)  # Enable CORS for all routes
 
 # Initialize Qdrant client
@@ -20,9 +34,33 @@ qdrant_client = QdrantClient(
     api_key=os.getenv("QDRANT_API_KEY", None)
 )
 
+# Pooled HTTP/2 client shared by all requests to the embedding API
+http_client = httpx.Client(
+    http2=True,
+    timeout=120,
+    limits=httpx.Limits(max_keepalive_connections=32, max_connections=64)
+)
+
 # Collection name to use
 COLLECTION_NAME = os.getenv("QDRANT_COLLECTION", "documents")
 
+# Embedding API configuration, read once at startup
+API_BASE_URL = os.getenv("API_BASE_URL", "http://localhost:11434/v1")
+EMBEDDING_MODEL = os.getenv("DEFAULT_EMBEDDING_MODEL", "snowflake-arctic-embed:latest")
+
+# Number of query embeddings kept in memory
+EMBEDDING_CACHE_SIZE = int(os.getenv("EMBEDDING_CACHE_SIZE", 4096))
+
+# Size of the HNSW candidate list at search time, trading recall for latency
+DEFAULT_HNSW_EF = int(os.getenv("HNSW_EF", 64))
+
+# Cache of search results reused for semantically similar queries
+semantic_cache = SemanticCache(
+    threshold=float(os.getenv("SEMANTIC_CACHE_THRESHOLD", 0.86)),
+    max_size=int(os.getenv("SEMANTIC_CACHE_SIZE", 1024)),
+    ttl=float(os.getenv("SEMANTIC_CACHE_TTL", 300))
+)
+
 @app.route('/')
 def index():
     """Serve the search interface as the index page."""
@@ -33,18 +71,21 @@ def get_all_documents():
     """
     Retrieve all documents from the Qdrant database.
     Supports pagination with limit and offset parameters.
+    Vectors are only included when requested with with_vectors=1.
     """
     try:
         # Get pagination parameters from query string
         limit = int(request.args.get('limit', 100))
         offset = int(request.args.get('offset', 0))
+        with_vectors = request.args.get('with_vectors', '0') == '1'
         
         # Retrieve all points from the collection
         response = qdrant_client.scroll(
             collection_name=COLLECTION_NAME,
             limit=limit,
             offset=offset,
-            with_payload=True
+            with_payload=True,
+            with_vectors=with_vectors
         )
         
         # Format the response
@@ -52,9 +93,10 @@ def get_all_documents():
         for point in response[0]:  # response[0] contains the points
             doc = {
                 'id': point.id,
-                'payload': point.payload,
-                'vector': point.vector
+                'payload': point.payload
             }
+            if with_vectors:
+                doc['vector'] = point.vector
             documents.append(doc)
         
         return jsonify({
@@ -85,6 +127,15 @@ def search_documents():
         
         query_text = data['query']
         limit = data.get('limit', 4)
+        try:
+            hnsw_ef = int(data.get('ef', DEFAULT_HNSW_EF))
+        except (TypeError, ValueError):
+            hnsw_ef = 0
+        if hnsw_ef < 1:
+            return jsonify({
+                'status': 'error',
+                'message': 'ef must be a positive integer'
+            }), 400
         metadata_filters = data.get('filters', {})
         
         # Convert metadata filters to Qdrant filter format
@@ -106,12 +157,24 @@ def search_documents():
     
         query_vector = _get_embeddings(query_text)
         
-        search_results = qdrant_client.search(
+        # Reuse the results of a similar earlier query with the same parameters
+        cache_key = (limit, hnsw_ef, sorted(metadata_filters.items()))
+        cached_results = semantic_cache.get(query_vector, cache_key)
+        if cached_results is not None:
+            return jsonify({
+                'status': 'success',
+                'data': cached_results
+            }), 200
+        
+        search_results = qdrant_client.query_points(
             collection_name=COLLECTION_NAME,
-            query_vector=query_vector,
+            query=query_vector,
             query_filter=search_filter,
-            limit=limit
-        )
+            limit=limit,
+            search_params=models.SearchParams(hnsw_ef=hnsw_ef, exact=False),
+            with_payload=True,
+            with_vectors=False
+        ).points
         
         # Format the response
         results = []
@@ -123,6 +186,8 @@ def search_documents():
             }
             results.append(result)
         
+        semantic_cache.put(query_vector, results, cache_key)
+        
         return jsonify({
             'status': 'success',
             'data': results
@@ -134,16 +199,41 @@ def search_documents():
             'message': str(e)
         }), 500
 
+@app.route('/api/cache/stats', methods=['GET'])
+def get_cache_stats():
+    """
+    Report hit/miss statistics of the query embedding and semantic caches.
+    """
+    info = _embed_cached.cache_info()
+    return jsonify({
+        'status': 'success',
+        'data': {
+            'embedding': {
+                'hits': info.hits,
+                'misses': info.misses,
+                'size': info.currsize,
+                'max_size': info.maxsize
+            },
+            'semantic': {
+                'hits': semantic_cache.hits,
+                'misses': semantic_cache.misses,
+                'size': len(semantic_cache),
+                'max_size': semantic_cache.max_size
+            }
+        }
+    }), 200
 
 
-def _get_embeddings(text: str) -> List[float]:
-    """Get embeddings from the OpenAI API.
-        
+@lru_cache(maxsize=EMBEDDING_CACHE_SIZE)
+def _embed_cached(model: str, text: str) -> Tuple[float, ...]:
+    """Get embeddings from the OpenAI API, caching them by (model, text).
+    
     Args:
+            model: The model to use for embeddings
             text: Text to generate embeddings for
             
     Returns:
-            List of embedding values
+            Tuple of embedding values (immutable so cached entries can be shared)
     """
     headers = {
         "Content-Type": "application/json"
@@ -151,17 +241,28 @@ def _get_embeddings(text: str) -> List[float]:
         
     data = {
         "input": text,
-        "model": os.getenv("DEFAULT_EMBEDDING_MODEL")
+        "model": model
     }
         
-    response = requests.post(
-        f'{os.getenv("API_BASE_URL")}/embeddings',
+    response = http_client.post(
+        f"{API_BASE_URL}/embeddings",
         headers=headers,
-        json=data
+        content=orjson.dumps(data)
     )
     response.raise_for_status()
         
-    return response.json()["data"][0]["embedding"]
+    return tuple(orjson.loads(response.content)["data"][0]["embedding"])
+
+def _get_embeddings(text: str) -> List[float]:
+    """Get embeddings from the OpenAI API.
+        
+    Args:
+            text: Text to generate embeddings for
+            
+    Returns:
+            List of embedding values
+    """
+    return list(_embed_cached(EMBEDDING_MODEL, text))
 
 if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    app.run(host='0.0.0.0', port=5000)